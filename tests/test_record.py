@@ -1,11 +1,16 @@
+import copy
 import datetime
 import os
+import pickle
 import shutil
 import unittest
 
 import numpy as np
 
 import wfdb
+from wfdb.io import _header, download
+
+from tests.test_url import DummyHTTPServer
 
 
 class TestRecord(unittest.TestCase):
@@ -602,6 +607,117 @@ def test_header_with_non_utf8(self):
         ]
         assert record.units.__eq__(sig_units_target)
 
+    def test_header_fs_rounding(self):
+        """
+        Write sampling frequencies within floating point error of an
+        integer as integers.
+        """
+        record = wfdb.rdheader("sample-data/100")
+        for fs, fs_target in [
+            (360.0, "360"),
+            (360.000000001, "360"),
+            (359.999999999, "360"),
+            (360.5, "360.5"),
+        ]:
+            record.fs = fs
+            record.wrheader()
+            with open("100.hea") as f:
+                self.assertEqual(f.readline().split()[2], fs_target)
+            self.assertEqual(wfdb.rdheader("100").fs, float(fs_target))
+
+    def test_header_base_time(self):
+        """
+        Parse valid base times, and reject malformed ones rather than
+        reading only part of them.
+        """
+        for base_time, target in [
+            ("5", datetime.time(0, 0, 5)),
+            ("12:30", datetime.time(0, 12, 30)),
+            ("1:02:03.25", datetime.time(1, 2, 3, 250000)),
+        ]:
+            record_fields = _header._parse_record_line(
+                "rec 1 360 1000 " + base_time + " 01/02/2003"
+            )
+            self.assertEqual(record_fields["base_time"], target)
+            self.assertEqual(
+                record_fields["base_date"], datetime.date(2003, 2, 1)
+            )
+
+        for base_time in ["12::30", "12:30:", ".5"]:
+            with self.assertRaises(ValueError):
+                _header._parse_record_line(
+                    "rec 1 360 1000 " + base_time + " 01/02/2003"
+                )
+
+    def test_header_field_spec_copy(self):
+        """
+        Copy and pickle the header field specifications.
+        """
+        spec = _header.SIGNAL_SPECS["adc_gain"]
+        for spec_copy in [
+            copy.copy(spec),
+            copy.deepcopy(spec),
+            pickle.loads(pickle.dumps(spec)),
+        ]:
+            self.assertEqual(spec_copy, spec)
+            self.assertEqual(spec_copy.allowed_types, spec.allowed_types)
+        self.assertEqual(
+            copy.deepcopy(_header.FIELD_SPECS), _header.FIELD_SPECS
+        )
+
+    def test_stream_chunks(self):
+        """
+        Stream a record from a local server in consecutive chunks, and
+        compare it to the local record.
+        """
+        file_content = {}
+        for file_name in ("100.hea", "100.dat"):
+            with open(os.path.join("sample-data", file_name), "rb") as f:
+                file_content["/db/1.0.0/" + file_name] = f.read()
+
+        with DummyHTTPServer(file_content) as server:
+            download.set_db_index_url(server.url())
+            try:
+                for sampfrom in range(0, 30000, 1000):
+                    record_pn = wfdb.rdrecord(
+                        "100",
+                        pn_dir="db/1.0.0",
+                        sampfrom=sampfrom,
+                        sampto=sampfrom + 1000,
+                        physical=False,
+                    )
+                    record = wfdb.rdrecord(
+                        "sample-data/100",
+                        sampfrom=sampfrom,
+                        sampto=sampfrom + 1000,
+                        physical=False,
+                    )
+                    np.testing.assert_array_equal(
+                        record_pn.d_signal, record.d_signal
+                    )
+
+                # Changes to the remote dat file are seen by later reads
+                dat_size = len(file_content["/db/1.0.0/100.dat"])
+                server.file_content["/db/1.0.0/100.dat"] = bytes(dat_size)
+                record_pn = wfdb.rdrecord(
+                    "100",
+                    pn_dir="db/1.0.0",
+                    sampfrom=sampfrom,
+                    sampto=sampfrom + 1000,
+                    physical=False,
+                )
+                self.assertFalse(record_pn.d_signal.any())
+
+                # Headers from a custom mirror are not cached either
+                header = file_content["/db/1.0.0/100.hea"]
+                server.file_content["/db/1.0.0/100.hea"] = header.replace(
+                    b" 360 ", b" 180 ", 1
+                )
+                record_pn = wfdb.rdheader("100", pn_dir="db/1.0.0")
+                self.assertEqual(record_pn.fs, 180)
+            finally:
+                download.set_db_index_url()
+
     @classmethod
     def tearDownClass(cls):
         "Clean up written files"
@@ -870,6 +986,39 @@ def test_multi_variable_d(self):
         assert record.__eq__(record_pn)
         assert record.__eq__(record_named)
 
+    def test_multi_remote_segments(self):
+        """
+        Multi-segment, variable layout, read segment headers from a
+        local server and compare them to the local headers.
+        """
+        record_dir = "sample-data/multi-segment/s00001"
+        record_name = "s00001-2896-10-10-00-31"
+        file_content = {}
+        for file_name in os.listdir(record_dir):
+            if file_name.endswith(".hea"):
+                with open(os.path.join(record_dir, file_name), "rb") as f:
+                    file_content["/db/1.0.0/" + file_name] = f.read()
+
+        record = wfdb.rdheader(
+            os.path.join(record_dir, record_name), rd_segments=True
+        )
+        with DummyHTTPServer(file_content) as server:
+            download.set_db_index_url(server.url())
+            try:
+                record_pn = wfdb.rdheader(
+                    record_name, pn_dir="db/1.0.0", rd_segments=True
+                )
+            finally:
+                download.set_db_index_url()
+
+        self.assertEqual(record_pn.seg_name, record.seg_name)
+        self.assertEqual(record_pn.sig_segments, record.sig_segments)
+        for seg, seg_pn in zip(record.segments, record_pn.segments):
+            if seg is None:
+                self.assertIsNone(seg_pn)
+            else:
+                self.assertEqual(seg_pn, seg)
+
 
 class TestTimeConversion(unittest.TestCase):
     """
@@ -968,6 +1117,54 @@ def test_dl_database_no_dat_file(self):
     def test_dl_database_with_dat_file(self):
         wfdb.dl_database("afdb", "./download-tests/", ["04015"])
 
+    # Test downloading several files concurrently from a local server
+    def test_dl_pn_files(self):
+        file_content = {
+            "/db/1.0.0/100.hea": b"100 1 360 10\n",
+            "/db/1.0.0/100.dat": bytes(range(20)),
+            "/db/1.0.0/100.atr": bytes(range(10)),
+        }
+        dl_inputs = [
+            (name, "", "db/1.0.0", "./download-tests/", True, False)
+            for name in ("100.hea", "100.dat", "100.atr")
+        ]
+        with DummyHTTPServer(file_content) as server:
+            download.set_db_index_url(server.url())
+            try:
+                download.make_local_dirs("./download-tests/", dl_inputs, True)
+                download.dl_pn_files(dl_inputs)
+                # Partially downloaded files are completed, and complete
+                # files are left alone
+                with open("./download-tests/100.dat", "r+b") as f:
+                    f.truncate(5)
+                download.dl_pn_files(dl_inputs)
+            finally:
+                download.set_db_index_url()
+
+        for path, content in file_content.items():
+            file_name = os.path.join("./download-tests", path.split("/")[-1])
+            with open(file_name, "rb") as f:
+                self.assertEqual(f.read(), content)
+
+    # Test that a failed download leaves the local file untouched
+    def test_dl_full_file_missing(self):
+        os.makedirs("./download-tests/missing/")
+        local_file = "./download-tests/missing/100.dat"
+        with DummyHTTPServer({}) as server:
+            url = server.url("/db/100.dat")
+            with self.assertRaises(FileNotFoundError):
+                download.dl_full_file(url, local_file)
+            self.assertFalse(os.path.exists(local_file))
+
+            with open(local_file, "wb") as f:
+                f.write(b"precious")
+            with self.assertRaises(FileNotFoundError):
+                download.dl_full_file(url, local_file)
+
+        with open(local_file, "rb") as f:
+            self.assertEqual(f.read(), b"precious")
+        self.assertEqual(os.listdir("./download-tests/missing/"), ["100.dat"])
+
     # Cleanup written files
     @classmethod
     def tearDownClass(self):
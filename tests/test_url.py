@@ -1,5 +1,6 @@
 import gzip
 import http.server
+import socket
 import threading
 import unittest
 
@@ -58,6 +59,47 @@ def test_requests(self):
                         self._test_text(url, text_data, buffering)
                         self._test_binary(url, binary_data, buffering)
 
+    def test_session(self):
+        """
+        Test that remote files are requested through a shared session.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        N/A
+
+        """
+        session = wfdb.io._url._get_session()
+        self.assertIs(wfdb.io._url._get_session(), session)
+
+        for protocol in ("http://", "https://"):
+            adapter = session.get_adapter(protocol + "example.com/")
+            self.assertEqual(
+                adapter.max_retries.total, wfdb.io._url.MAX_RETRIES
+            )
+            pool_kw = adapter.poolmanager.connection_pool_kw
+            self.assertEqual(pool_kw["maxsize"], wfdb.io._url.MAX_CONNECTIONS)
+            self.assertIn(
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                pool_kw["socket_options"],
+            )
+            # Connections through a proxy use the same socket options
+            proxy_manager = adapter.proxy_manager_for("http://127.0.0.1:3128")
+            self.assertEqual(
+                proxy_manager.connection_pool_kw["socket_options"],
+                pool_kw["socket_options"],
+            )
+
+        with DummyHTTPServer(file_content={"/foo.txt": b"foo"}) as server:
+            with wfdb.io._url.openurl(server.url("/foo.txt"), "rb") as bf:
+                self.assertEqual(bf.read(), b"foo")
+            with self.assertRaises(wfdb.io._url.NetFileNotFoundError):
+                with wfdb.io._url.openurl(server.url("/bar.txt"), "rb") as bf:
+                    bf.read()
+
     def _test_text(self, url, content, buffering):
         """
         Test reading a URL using text-mode file APIs.
@@ -195,6 +237,13 @@ def _test_binary(self, url, content, buffering):
             self.assertEqual(result, content)
             self.assertEqual(bf.tell(), len(content))
 
+        # seek(), iter_chunks()
+        with wfdb.io._url.openurl(url, "rb", buffering=buffering) as bf:
+            bf.seek(5)
+            result = b"".join(bf.iter_chunks())
+            self.assertEqual(result, content[5:])
+            self.assertEqual(bf.tell(), len(content))
+
 
 class TestRemoteFLACFiles(unittest.TestCase):
     """
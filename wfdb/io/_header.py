@@ -1,9 +1,9 @@
 import datetime
 import re
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 
 from wfdb.io import _signal
 from wfdb.io import util
@@ -42,100 +42,138 @@
 int_types = (int, np.int64, np.int32, np.int16, np.int8)
 float_types = (float, np.float64, np.float32) + int_types
 
-_SPECIFICATION_COLUMNS = [
-    "allowed_types",
-    "delimiter",
-    "dependency",
-    "write_required",
-    "read_default",
-    "write_default",
-]
-
-RECORD_SPECS = pd.DataFrame(
-    index=[
-        "record_name",
-        "n_seg",
-        "n_sig",
-        "fs",
-        "counter_freq",
-        "base_counter",
-        "sig_len",
-        "base_time",
-        "base_date",
-    ],
-    columns=_SPECIFICATION_COLUMNS,
-    dtype="object",
-    data=[
-        [(str,), "", None, True, None, None],  # record_name
-        [int_types, "/", "record_name", True, None, None],  # n_seg
-        [int_types, " ", "record_name", True, None, None],  # n_sig
-        [float_types, " ", "n_sig", True, 250, None],  # fs
-        [float_types, "/", "fs", False, None, None],  # counter_freq
-        [float_types, "(", "counter_freq", False, None, None],  # base_counter
-        [int_types, " ", "fs", True, None, None],  # sig_len
-        [
-            (datetime.time,),
-            " ",
-            "sig_len",
-            False,
-            None,
-            "00:00:00",
-        ],  # base_time
-        [(datetime.date,), " ", "base_time", False, None, None],  # base_date
-    ],
-)
 
-SIGNAL_SPECS = pd.DataFrame(
-    index=[
-        "file_name",
-        "fmt",
-        "samps_per_frame",
-        "skew",
-        "byte_offset",
-        "adc_gain",
-        "baseline",
-        "units",
-        "adc_res",
-        "adc_zero",
-        "init_value",
-        "checksum",
-        "block_size",
-        "sig_name",
-    ],
-    columns=_SPECIFICATION_COLUMNS,
-    dtype="object",
-    data=[
-        [(str,), "", None, True, None, None],  # file_name
-        [(str,), " ", "file_name", True, None, None],  # fmt
-        [int_types, "x", "fmt", False, 1, None],  # samps_per_frame
-        [int_types, ":", "fmt", False, None, None],  # skew
-        [int_types, "+", "fmt", False, None, None],  # byte_offset
-        [float_types, " ", "fmt", True, 200.0, None],  # adc_gain
-        [int_types, "(", "adc_gain", True, 0, None],  # baseline
-        [(str,), "/", "adc_gain", True, "mV", None],  # units
-        [int_types, " ", "adc_gain", False, None, 0],  # adc_res
-        [int_types, " ", "adc_res", False, None, 0],  # adc_zero
-        [int_types, " ", "adc_zero", False, None, None],  # init_value
-        [int_types, " ", "init_value", False, None, None],  # checksum
-        [int_types, " ", "checksum", False, None, 0],  # block_size
-        [(str,), " ", "block_size", False, None, None],  # sig_name
-    ],
-)
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Specification of a WFDB header field.
 
-SEGMENT_SPECS = pd.DataFrame(
-    index=["seg_name", "seg_len"],
-    columns=_SPECIFICATION_COLUMNS,
-    dtype="object",
-    data=[
-        [(str), "", None, True, None, None],  # seg_name
-        [int_types, " ", "seg_name", True, None, None],  # seg_len
-    ],
-)
+    Attributes
+    ----------
+    allowed_types : tuple
+        The types allowed for the field's value, or for each of its
+        elements for signal and segment fields.
+    delimiter : str
+        The delimiter written before the field in the header.
+    dependency : str
+        The field which must also be written if this field is written,
+        or None if there is none.
+    write_required : bool
+        Whether the field must always be written.
+    read_default : object
+        The value of the field when it is missing from a header.
+    write_default : object
+        The value given to the field by `set_defaults` when writing, if
+        it is missing.
+
+    """
+
+    # Slots avoid a per-instance __dict__ and speed up attribute reads.
+    # (dataclass(slots=True) requires Python 3.10.)
+    __slots__ = (
+        "allowed_types",
+        "delimiter",
+        "dependency",
+        "write_required",
+        "read_default",
+        "write_default",
+    )
+
+    allowed_types: tuple
+    delimiter: str
+    dependency: Optional[str]
+    write_required: bool
+    read_default: Any
+    write_default: Any
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        # Used by copy and pickle. The frozen __setattr__ rejects
+        # assignment, so the slots are set directly.
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+RECORD_SPECS = {
+    "record_name": FieldSpec((str,), "", None, True, None, None),
+    "n_seg": FieldSpec(int_types, "/", "record_name", True, None, None),
+    "n_sig": FieldSpec(int_types, " ", "record_name", True, None, None),
+    "fs": FieldSpec(float_types, " ", "n_sig", True, 250, None),
+    "counter_freq": FieldSpec(float_types, "/", "fs", False, None, None),
+    "base_counter": FieldSpec(
+        float_types, "(", "counter_freq", False, None, None
+    ),
+    "sig_len": FieldSpec(int_types, " ", "fs", True, None, None),
+    "base_time": FieldSpec(
+        (datetime.time,), " ", "sig_len", False, None, "00:00:00"
+    ),
+    "base_date": FieldSpec(
+        (datetime.date,), " ", "base_time", False, None, None
+    ),
+}
+
+SIGNAL_SPECS = {
+    "file_name": FieldSpec((str,), "", None, True, None, None),
+    "fmt": FieldSpec((str,), " ", "file_name", True, None, None),
+    "samps_per_frame": FieldSpec(int_types, "x", "fmt", False, 1, None),
+    "skew": FieldSpec(int_types, ":", "fmt", False, None, None),
+    "byte_offset": FieldSpec(int_types, "+", "fmt", False, None, None),
+    "adc_gain": FieldSpec(float_types, " ", "fmt", True, 200.0, None),
+    "baseline": FieldSpec(int_types, "(", "adc_gain", True, 0, None),
+    "units": FieldSpec((str,), "/", "adc_gain", True, "mV", None),
+    "adc_res": FieldSpec(int_types, " ", "adc_gain", False, None, 0),
+    "adc_zero": FieldSpec(int_types, " ", "adc_res", False, None, 0),
+    "init_value": FieldSpec(int_types, " ", "adc_zero", False, None, None),
+    "checksum": FieldSpec(int_types, " ", "init_value", False, None, None),
+    "block_size": FieldSpec(int_types, " ", "checksum", False, None, 0),
+    "sig_name": FieldSpec((str,), " ", "block_size", False, None, None),
+}
+
+SEGMENT_SPECS = {
+    "seg_name": FieldSpec((str,), "", None, True, None, None),
+    "seg_len": FieldSpec(int_types, " ", "seg_name", True, None, None),
+}
 
 # Specifications of all WFDB header fields, except for comments
-FIELD_SPECS = pd.concat((RECORD_SPECS, SIGNAL_SPECS, SEGMENT_SPECS))
+FIELD_SPECS = {**RECORD_SPECS, **SIGNAL_SPECS, **SEGMENT_SPECS}
+
+# Record fields of multi-segment and single segment records (which
+# have no n_seg field), and signal fields
+_RECORD_FIELDS = tuple(RECORD_SPECS)
+_RECORD_FIELDS_NO_NSEG = tuple(f for f in RECORD_SPECS if f != "n_seg")
+_SIGNAL_FIELDS = tuple(SIGNAL_SPECS)
+
+# The fields in the order they are written to header lines, with the
+# delimiter written before each field and the string closing it.
+_RECORD_WRITE_ORDER = tuple(
+    (field, spec.delimiter, ")" if field == "base_counter" else "")
+    for field, spec in RECORD_SPECS.items()
+)
+_SIGNAL_WRITE_ORDER = tuple(
+    (field, spec.delimiter, ")" if field == "baseline" else "")
+    for field, spec in SIGNAL_SPECS.items()
+)
+_SEGMENT_WRITE_ORDER = tuple(
+    (field, spec.delimiter) for field, spec in SEGMENT_SPECS.items()
+)
+
+# The fields in the order they are read from header lines, with their
+# read defaults and allowed types, to be unpacked in the parsing loops.
+_RECORD_READ_ORDER = tuple(
+    (field, spec.read_default, spec.allowed_types)
+    for field, spec in RECORD_SPECS.items()
+)
+_SIGNAL_READ_ORDER = tuple(
+    (field, spec.read_default, spec.allowed_types)
+    for field, spec in SIGNAL_SPECS.items()
+)
 
-# Regexp objects for reading headers
+# Regexp objects for reading headers. Record and segment lines only
+# contain ASCII names and numbers, so those patterns are compiled with
+# re.ASCII, which makes matching faster. Signal lines may contain
+# arbitrary units and descriptions.
 # Record line
 _rx_record = re.compile(
     r"""
@@ -149,7 +187,7 @@
     [ \t]* (?P<base_time>\d{,2}:?\d{,2}:?\d{,2}\.?\d{,6})
     [ \t]* (?P<base_date>\d{,2}/?\d{,2}/?\d{,4})
     """,
-    re.VERBOSE,
+    re.VERBOSE | re.ASCII,
 )
 
 # Signal line
@@ -168,7 +206,7 @@
     [ \t]* (?P<init_value>-?\d*)
     [ \t]* (?P<checksum>-?\d*)
     [ \t]* (?P<block_size>\d*)
-    [ \t]* (?P<sig_name>[\S]?[^\t\n\r\f\v]*)
+    [ \t]* (?P<sig_name>[^\t\n\r\f\v]*)
     """,
     re.VERBOSE,
 )
@@ -179,7 +217,7 @@
     [ \t]* (?P<seg_name>[-\w]*~?)
     [ \t]+ (?P<seg_len>\d+)
     """,
-    re.VERBOSE,
+    re.VERBOSE | re.ASCII,
 )
 
 
@@ -217,76 +255,75 @@ def get_write_subset(self, spec_type):
 
         """
         if spec_type == "record":
-            write_fields = []
-            record_specs = RECORD_SPECS.copy()
+            # Insertion ordered dict used as a set, for fast membership
+            # tests
+            write_fields = {}
 
             # Remove the n_seg requirement for single segment items
-            if not hasattr(self, "n_seg"):
-                record_specs.drop("n_seg", inplace=True)
+            if hasattr(self, "n_seg"):
+                record_fields = _RECORD_FIELDS
+            else:
+                record_fields = _RECORD_FIELDS_NO_NSEG
 
-            for field in record_specs.index[-1::-1]:
+            for field in reversed(record_fields):
                 # Continue if the field has already been included
                 if field in write_fields:
                     continue
                 # If the field is required by default or has been
                 # defined by the user
                 if (
-                    record_specs.loc[field, "write_required"]
+                    RECORD_SPECS[field].write_required
                     or getattr(self, field) is not None
                 ):
                     req_field = field
-                    # Add the field and its recursive dependencies
-                    while req_field is not None:
-                        write_fields.append(req_field)
-                        req_field = record_specs.loc[req_field, "dependency"]
+                    # Add the field and its recursive dependencies,
+                    # stopping at any field that is already included
+                    # along with its own dependencies
+                    while (
+                        req_field is not None and req_field not in write_fields
+                    ):
+                        write_fields[req_field] = None
+                        req_field = RECORD_SPECS[req_field].dependency
             # Add comments if any
             if getattr(self, "comments") is not None:
-                write_fields.append("comments")
+                write_fields["comments"] = None
+
+            write_fields = list(write_fields)
 
         # signal spec field. Need to return a potentially different list for each channel.
         elif spec_type == "signal":
-            # List of lists for each channel
-            write_fields = []
-            signal_specs = SIGNAL_SPECS.copy()
-
-            for ch in range(self.n_sig):
-                # The fields needed for this channel
-                write_fields_ch = []
-                for field in signal_specs.index[-1::-1]:
-                    if field in write_fields_ch:
-                        continue
-
+            # The channels in which each field is needed
+            field_channels = {field: set() for field in _SIGNAL_FIELDS}
+
+            # Each field's dependency comes before it in the
+            # specification, so traversing the fields in reverse visits
+            # every field after all of the fields that depend on it.
+            for field in reversed(_SIGNAL_FIELDS):
+                channels = field_channels[field]
+                # If the field is required by default or has been
+                # defined by the user
+                if SIGNAL_SPECS[field].write_required:
+                    channels.update(range(self.n_sig))
+                else:
                     item = getattr(self, field)
-                    # If the field is required by default or has been defined by the user
-                    if signal_specs.loc[field, "write_required"] or (
-                        item is not None and item[ch] is not None
-                    ):
-                        req_field = field
-                        # Add the field and its recursive dependencies
-                        while req_field is not None:
-                            write_fields_ch.append(req_field)
-                            req_field = signal_specs.loc[
-                                req_field, "dependency"
-                            ]
-
-                write_fields.append(write_fields_ch)
+                    if item is not None:
+                        channels.update(
+                            ch
+                            for ch in range(self.n_sig)
+                            if item[ch] is not None
+                        )
+                # Add the field's channels to its dependency
+                dependency = SIGNAL_SPECS[field].dependency
+                if dependency is not None:
+                    field_channels[dependency] |= channels
 
-            # Convert the list of lists to a single dictionary.
             # keys = field and value = list of channels in which the
-            # field is required.
-            dict_write_fields = {}
-
-            # For fields present in any channel:
-            for field in set(
-                [i for write_fields_ch in write_fields for i in write_fields_ch]
-            ):
-                dict_write_fields[field] = []
-
-                for ch in range(self.n_sig):
-                    if field in write_fields[ch]:
-                        dict_write_fields[field].append(ch)
-
-            write_fields = dict_write_fields
+            # field is required, for fields present in any channel.
+            write_fields = {
+                field: sorted(channels)
+                for field, channels in field_channels.items()
+                if channels
+            }
 
         return write_fields
 
@@ -432,19 +469,19 @@ def set_default(self, field):
 
         """
         # Record specification fields
-        if field in RECORD_SPECS.index:
+        if field in RECORD_SPECS:
             # Return if no default to set, or if the field is already
             # present.
             if (
-                RECORD_SPECS.loc[field, "write_default"] is None
+                RECORD_SPECS[field].write_default is None
                 or getattr(self, field) is not None
             ):
                 return
-            setattr(self, field, RECORD_SPECS.loc[field, "write_default"])
+            setattr(self, field, RECORD_SPECS[field].write_default)
 
         # Signal specification fields
         # Setting entire list default, not filling in blanks in lists.
-        elif field in SIGNAL_SPECS.index:
+        elif field in SIGNAL_SPECS:
 
             # Specific dynamic case
             if field == "file_name" and self.file_name is None:
@@ -455,10 +492,7 @@ def set_default(self, field):
 
             # Return if no default to set, or if the field is already
             # present.
-            if (
-                SIGNAL_SPECS.loc[field, "write_default"] is None
-                or item is not None
-            ):
+            if SIGNAL_SPECS[field].write_default is None or item is not None:
                 return
 
             # Set more specific defaults if possible
@@ -467,9 +501,7 @@ def set_default(self, field):
                 return
 
             setattr(
-                self,
-                field,
-                [SIGNAL_SPECS.loc[field, "write_default"]] * self.n_sig,
+                self, field, [SIGNAL_SPECS[field].write_default] * self.n_sig
             )
 
     def check_field_cohesion(self, rec_write_fields, sig_write_fields):
@@ -500,33 +532,31 @@ def check_field_cohesion(self, rec_write_fields, sig_write_fields):
                         "The length of field: " + f + " must match field n_sig."
                     )
 
-            # Each file_name must correspond to only one fmt, (and only one byte offset if defined).
+            # Each file_name must correspond to only one fmt, (and only
+            # one byte offset if defined). Record the first value seen
+            # for each file and compare the rest against it.
             datfmts = {}
-            for ch in range(self.n_sig):
-                if self.file_name[ch] not in datfmts:
-                    datfmts[self.file_name[ch]] = self.fmt[ch]
-                else:
-                    if datfmts[self.file_name[ch]] != self.fmt[ch]:
-                        raise ValueError(
-                            "Each file_name (dat file) specified must have the same fmt"
-                        )
+            for file_name, fmt in zip(self.file_name, self.fmt):
+                if datfmts.setdefault(file_name, fmt) != fmt:
+                    raise ValueError(
+                        "Each file_name (dat file) specified must have the same fmt"
+                    )
 
-            datoffsets = {}
             if self.byte_offset is not None:
                 # At least one byte offset value exists
-                for ch in range(self.n_sig):
-                    if self.byte_offset[ch] is None:
+                datoffsets = {}
+                for file_name, byte_offset in zip(
+                    self.file_name, self.byte_offset
+                ):
+                    if byte_offset is None:
                         continue
-                    if self.file_name[ch] not in datoffsets:
-                        datoffsets[self.file_name[ch]] = self.byte_offset[ch]
-                    else:
-                        if (
-                            datoffsets[self.file_name[ch]]
-                            != self.byte_offset[ch]
-                        ):
-                            raise ValueError(
-                                "Each file_name (dat file) specified must have the same byte offset"
-                            )
+                    if (
+                        datoffsets.setdefault(file_name, byte_offset)
+                        != byte_offset
+                    ):
+                        raise ValueError(
+                            "Each file_name (dat file) specified must have the same byte offset"
+                        )
 
     def wr_header_file(self, rec_write_fields, sig_write_fields, write_dir):
         """
@@ -548,55 +578,57 @@ def wr_header_file(self, rec_write_fields, sig_write_fields, write_dir):
         N/A
 
         """
-        # Create record specification line
-        record_line = ""
-        # Traverse the ordered dictionary
-        for field in RECORD_SPECS.index:
+        # Only membership tests are needed from here on
+        rec_write_fields = frozenset(rec_write_fields)
+
+        # Create record specification line, collecting its parts to
+        # join once at the end
+        record_parts = []
+        # Traverse the fields in order
+        for field, delimiter, closing in _RECORD_WRITE_ORDER:
             # If the field is being used, add it with its delimiter
             if field in rec_write_fields:
-                string_field = str(getattr(self, field))
-
                 # Certain fields need extra processing
-                if field == "fs" and isinstance(self.fs, float):
-                    if round(self.fs, 8) == float(int(self.fs)):
-                        string_field = str(int(self.fs))
-                elif field == "base_time" and "." in string_field:
-                    string_field = string_field.rstrip("0")
+                if (
+                    field == "fs"
+                    and isinstance(self.fs, float)
+                    and round(self.fs, 8).is_integer()
+                ):
+                    string_field = str(round(self.fs))
+                elif field == "base_time":
+                    # Format directly rather than trimming str(). Leave
+                    # out trailing zeros of fractional seconds.
+                    t = self.base_time
+                    string_field = f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+                    if t.microsecond:
+                        string_field += f".{t.microsecond:06d}".rstrip("0")
                 elif field == "base_date":
-                    string_field = "/".join(
-                        (string_field[8:], string_field[5:7], string_field[:4])
-                    )
+                    d = self.base_date
+                    string_field = f"{d.day:02d}/{d.month:02d}/{d.year:04d}"
+                else:
+                    string_field = str(getattr(self, field))
 
-                record_line += (
-                    RECORD_SPECS.loc[field, "delimiter"] + string_field
-                )
                 # The 'base_counter' field needs to be closed with ')'
-                if field == "base_counter":
-                    record_line += ")"
+                record_parts += (delimiter, string_field, closing)
 
-        header_lines = [record_line]
+        header_lines = ["".join(record_parts)]
 
-        # Create signal specification lines (if any) one channel at a time
+        # Create signal specification lines (if any), one field at a
+        # time so each field's values are fetched only once
         if self.n_sig > 0:
-            signal_lines = self.n_sig * [""]
-            for ch in range(self.n_sig):
-                # Traverse the signal fields
-                for field in SIGNAL_SPECS.index:
-                    # If the field is being used, add each of its
-                    # elements with the delimiter to the appropriate
-                    # line
-                    if (
-                        field in sig_write_fields
-                        and ch in sig_write_fields[field]
-                    ):
-                        signal_lines[ch] += SIGNAL_SPECS.loc[
-                            field, "delimiter"
-                        ] + str(getattr(self, field)[ch])
-                    # The 'baseline' field needs to be closed with ')'
-                    if field == "baseline":
-                        signal_lines[ch] += ")"
+            signal_parts = [[] for _ in range(self.n_sig)]
+            # Traverse the signal fields
+            for field, delimiter, closing in _SIGNAL_WRITE_ORDER:
+                if field not in sig_write_fields:
+                    continue
+                values = getattr(self, field)
+                # Add each of the field's elements with the delimiter to
+                # the lines of the channels that use it. The 'baseline'
+                # field needs to be closed with ')'
+                for ch in sig_write_fields[field]:
+                    signal_parts[ch] += (delimiter, str(values[ch]), closing)
 
-            header_lines += signal_lines
+            header_lines += ["".join(parts) for parts in signal_parts]
 
         # Create comment lines (if any)
         if "comments" in rec_write_fields:
@@ -717,11 +749,11 @@ def set_default(self, field):
         if field in RECORD_SPECS:
             # Return if no default to set, or if the field is already present.
             if (
-                RECORD_SPECS[field].write_def is None
+                RECORD_SPECS[field].write_default is None
                 or getattr(self, field) is not None
             ):
                 return
-            setattr(self, field, RECORD_SPECS[field].write_def)
+            setattr(self, field, RECORD_SPECS[field].write_default)
 
     def check_field_cohesion(self):
         """
@@ -744,7 +776,7 @@ def check_field_cohesion(self):
                 )
 
         # Check the sum of the 'seg_len' fields against 'sig_len'
-        if np.sum(self.seg_len) != self.sig_len:
+        if sum(self.seg_len) != self.sig_len:
             raise ValueError(
                 "The sum of the 'seg_len' fields do not match the 'sig_len' field"
             )
@@ -766,29 +798,28 @@ def wr_header_file(self, write_fields, write_dir):
         N/A
 
         """
+        # Only membership tests are needed from here on
+        write_fields = frozenset(write_fields)
+
         # Create record specification line
-        record_line = ""
-        # Traverse the ordered dictionary
-        for field in RECORD_SPECS.index:
+        record_parts = []
+        # Traverse the fields in order
+        for field, delimiter, closing in _RECORD_WRITE_ORDER:
             # If the field is being used, add it with its delimiter
             if field in write_fields:
-                record_line += RECORD_SPECS.loc[field, "delimiter"] + str(
-                    getattr(self, field)
-                )
+                record_parts += (delimiter, str(getattr(self, field)), closing)
 
-        header_lines = [record_line]
+        header_lines = ["".join(record_parts)]
 
         # Create segment specification lines
-        segment_lines = self.n_seg * [""]
+        segment_parts = [[] for _ in range(self.n_seg)]
         # For both fields, add each of its elements with the delimiter
         # to the appropriate line
-        for field in SEGMENT_SPECS.index:
-            for seg_num in range(self.n_seg):
-                segment_lines[seg_num] += SEGMENT_SPECS.loc[
-                    field, "delimiter"
-                ] + str(getattr(self, field)[seg_num])
+        for field, delimiter in _SEGMENT_WRITE_ORDER:
+            for seg_num, value in enumerate(getattr(self, field)):
+                segment_parts[seg_num] += (delimiter, str(value))
 
-        header_lines = header_lines + segment_lines
+        header_lines += ["".join(parts) for parts in segment_parts]
 
         # Create comment lines (if any)
         if "comments" in write_fields:
@@ -826,10 +857,14 @@ def get_sig_segments(self, sig_name=None):
             sig_name = self.get_sig_name()
 
         if isinstance(sig_name, list):
-            sig_dict = {}
-            for sig in sig_name:
-                sig_dict[sig] = self.get_sig_segments(sig)
-            return sig_dict
+            # Map each signal name to its segments in a single pass over
+            # the segments, rather than searching them for every signal
+            seg_index = {}
+            for i in range(self.n_seg):
+                if self.seg_name[i] != "~":
+                    for s in set(self.segments[i].sig_name):
+                        seg_index.setdefault(s, []).append(i)
+            return {sig: seg_index.get(sig, []) for sig in sig_name}
         elif isinstance(sig_name, str):
             sig_segs = []
             for i in range(self.n_seg):
@@ -872,6 +907,18 @@ def get_sig_name(self):
         return sig_name
 
 
+# strptime formats of the WFDB time strings, by (number of colons,
+# whether microseconds are present)
+_TIME_FORMATS = {
+    (0, False): "%S",
+    (1, False): "%M:%S",
+    (2, False): "%H:%M:%S",
+    (0, True): "%S.%f",
+    (1, True): "%M:%S.%f",
+    (2, True): "%H:%M:%S.%f",
+}
+
+
 def wfdb_strptime(time_string: str) -> datetime.time:
     """
     Given a time string in an acceptable WFDB format, return
@@ -890,17 +937,7 @@ def wfdb_strptime(time_string: str) -> datetime.time:
         The time converted from str format.
 
     """
-    n_colons = time_string.count(":")
-
-    if n_colons == 0:
-        time_fmt = "%S"
-    elif n_colons == 1:
-        time_fmt = "%M:%S"
-    elif n_colons == 2:
-        time_fmt = "%H:%M:%S"
-
-    if "." in time_string:
-        time_fmt += ".%f"
+    time_fmt = _TIME_FORMATS[time_string.count(":"), "." in time_string]
 
     return datetime.datetime.strptime(time_string, time_fmt).time()
 
@@ -926,11 +963,14 @@ def parse_header_content(
     header_lines, comment_lines = [], []
     for line in header_content.splitlines():
         line = line.strip()
-        # Comment line
-        if line.startswith("#"):
+        # Skip empty lines
+        if not line:
+            continue
+        # Comment line (indexing is faster than calling startswith)
+        if line[0] == "#":
             comment_lines.append(line)
         # Non-empty non-comment line = header line.
-        elif line:
+        else:
             header_lines.append(line)
 
     return header_lines, comment_lines
@@ -951,51 +991,35 @@ def _parse_record_line(record_line: str) -> dict:
         The fields for the given record line.
 
     """
-    # Dictionary for record fields
-    record_fields = {}
-
     # Read string fields from record line
     match = _rx_record.match(record_line)
     if match is None:
         raise HeaderSyntaxError("invalid syntax in record line")
-    (
-        record_fields["record_name"],
-        record_fields["n_seg"],
-        record_fields["n_sig"],
-        record_fields["fs"],
-        record_fields["counter_freq"],
-        record_fields["base_counter"],
-        record_fields["sig_len"],
-        record_fields["base_time"],
-        record_fields["base_date"],
-    ) = match.groups()
-
-    for field in RECORD_SPECS.index:
+
+    # Dictionary for record fields
+    record_fields = {}
+
+    for (field, read_default, allowed_types), value in zip(
+        _RECORD_READ_ORDER, match.groups()
+    ):
         # Replace empty strings with their read defaults (which are
         # mostly None)
-        if record_fields[field] == "":
-            record_fields[field] = RECORD_SPECS.loc[field, "read_default"]
+        if value == "":
+            value = read_default
         # Typecast non-empty strings for non-string (numerical/datetime)
         # fields
-        else:
-            if RECORD_SPECS.loc[field, "allowed_types"] == int_types:
-                record_fields[field] = int(record_fields[field])
-            elif RECORD_SPECS.loc[field, "allowed_types"] == float_types:
-                record_fields[field] = float(record_fields[field])
-                # cast fs to an int if it is close
-                if field == "fs":
-                    fs = float(record_fields["fs"])
-                    if round(fs, 8) == float(int(fs)):
-                        fs = int(fs)
-                    record_fields["fs"] = fs
-            elif field == "base_time":
-                record_fields["base_time"] = wfdb_strptime(
-                    record_fields["base_time"]
-                )
-            elif field == "base_date":
-                record_fields["base_date"] = datetime.datetime.strptime(
-                    record_fields["base_date"], "%d/%m/%Y"
-                ).date()
+        elif allowed_types is int_types:
+            value = int(value)
+        elif allowed_types is float_types:
+            value = float(value)
+            # cast fs to an int if it is close
+            if field == "fs" and round(value, 8).is_integer():
+                value = round(value)
+        elif field == "base_time":
+            value = wfdb_strptime(value)
+        elif field == "base_date":
+            value = datetime.datetime.strptime(value, "%d/%m/%Y").date()
+        record_fields[field] = value
 
     # This is not a standard WFDB field, but is useful to set.
     if record_fields["base_date"] and record_fields["base_time"]:
@@ -1021,62 +1045,49 @@ def _parse_signal_lines(signal_lines):
         The fields for the given signal line.
 
     """
-    n_sig = len(signal_lines)
-    # Dictionary for signal fields
-    signal_fields = {}
-
-    # Each dictionary field is a list
-    for field in SIGNAL_SPECS.index:
-        signal_fields[field] = n_sig * [None]
-
-    # Read string fields from signal line
-    for ch in range(n_sig):
-        match = _rx_signal.match(signal_lines[ch])
+    # Read string fields from signal lines, one tuple per channel
+    rows = []
+    for line in signal_lines:
+        match = _rx_signal.match(line)
         if match is None:
             raise HeaderSyntaxError("invalid syntax in signal line")
-        (
-            signal_fields["file_name"][ch],
-            signal_fields["fmt"][ch],
-            signal_fields["samps_per_frame"][ch],
-            signal_fields["skew"][ch],
-            signal_fields["byte_offset"][ch],
-            signal_fields["adc_gain"][ch],
-            signal_fields["baseline"][ch],
-            signal_fields["units"][ch],
-            signal_fields["adc_res"][ch],
-            signal_fields["adc_zero"][ch],
-            signal_fields["init_value"][ch],
-            signal_fields["checksum"][ch],
-            signal_fields["block_size"][ch],
-            signal_fields["sig_name"][ch],
-        ) = match.groups()
-
-        for field in SIGNAL_SPECS.index:
-            # Replace empty strings with their read defaults (which are mostly None)
-            # Note: Never set a field to None. [None]* n_sig is accurate, indicating
-            # that different channels can be present or missing.
-            if signal_fields[field][ch] == "":
-                signal_fields[field][ch] = SIGNAL_SPECS.loc[
-                    field, "read_default"
-                ]
-
-                # Special case: missing baseline defaults to ADCzero if present
-                if field == "baseline" and signal_fields["adc_zero"][ch] != "":
-                    signal_fields["baseline"][ch] = int(
-                        signal_fields["adc_zero"][ch]
-                    )
-            # Typecast non-empty strings for numerical fields
-            else:
-                if SIGNAL_SPECS.loc[field, "allowed_types"] is int_types:
-                    signal_fields[field][ch] = int(signal_fields[field][ch])
-                elif SIGNAL_SPECS.loc[field, "allowed_types"] is float_types:
-                    signal_fields[field][ch] = float(signal_fields[field][ch])
-                    # Special case: adc_gain of 0 means 200
-                    if (
-                        field == "adc_gain"
-                        and signal_fields["adc_gain"][ch] == 0
-                    ):
-                        signal_fields["adc_gain"][ch] = 200.0
+        rows.append(match.groups())
+
+    # Transpose into one column of strings per field
+    if rows:
+        columns = dict(zip(SIGNAL_SPECS, zip(*rows)))
+    else:
+        columns = dict.fromkeys(SIGNAL_SPECS, ())
+
+    # Special case: missing baseline defaults to ADCzero if present
+    columns["baseline"] = [
+        adc_zero if baseline == "" else baseline
+        for baseline, adc_zero in zip(columns["baseline"], columns["adc_zero"])
+    ]
+
+    # Dictionary for signal fields. Each field is a list with one value
+    # per channel.
+    # Note: Never set a field to None. A list of per-channel values, some of
+    # which may be None, indicates that different channels can be present
+    # or missing.
+    signal_fields = {}
+    for field, read_default, allowed_types in _SIGNAL_READ_ORDER:
+        column = columns[field]
+        # Replace empty strings with their read defaults (which are mostly
+        # None), and typecast non-empty strings for numerical fields
+        if allowed_types is int_types:
+            values = [read_default if v == "" else int(v) for v in column]
+        elif allowed_types is float_types:
+            values = [read_default if v == "" else float(v) for v in column]
+        else:
+            values = [read_default if v == "" else v for v in column]
+        signal_fields[field] = values
+
+    # Special case: adc_gain of 0 means 200
+    signal_fields["adc_gain"] = [
+        200.0 if adc_gain == 0 else adc_gain
+        for adc_gain in signal_fields["adc_gain"]
+    ]
 
     return signal_fields
 
@@ -1096,26 +1107,17 @@ def _read_segment_lines(segment_lines):
         The fields for the given segment line.
 
     """
-    # Dictionary for segment fields
-    segment_fields = {}
-
-    # Each dictionary field is a list
-    for field in SEGMENT_SPECS.index:
-        segment_fields[field] = [None] * len(segment_lines)
-
-    # Read string fields from signal line
-    for i in range(len(segment_lines)):
-        match = _rx_segment.match(segment_lines[i])
-        if match is None:
-            raise HeaderSyntaxError("invalid syntax in segment line")
-        (
-            segment_fields["seg_name"][i],
-            segment_fields["seg_len"][i],
-        ) = match.groups()
-
-        # Typecast strings for numerical field
-        if field == "seg_len":
-            segment_fields["seg_len"][i] = int(segment_fields["seg_len"][i])
+    # Read string fields from segment lines
+    matches = [_rx_segment.match(line) for line in segment_lines]
+    if None in matches:
+        raise HeaderSyntaxError("invalid syntax in segment line")
+
+    # Dictionary for segment fields, from the seg_name and seg_len groups,
+    # typecasting the numerical field
+    segment_fields = {
+        "seg_name": [match[1] for match in matches],
+        "seg_len": [int(match[2]) for match in matches],
+    }
 
     return segment_fields
 
@@ -1684,7 +1684,7 @@ def _blocks_to_samples(sig_data, n_samp, fmt):
             added_samps = 0
 
         sig_data = sig_data.astype("int16")
-        sig = np.zeros(n_samp, dtype="int16")
+        sig = np.empty(n_samp, dtype="int16")
 
         # One sample pair is stored in one byte triplet.
 
@@ -1702,12 +1702,15 @@ def _blocks_to_samples(sig_data, n_samp, fmt):
             sig = sig[:-added_samps]
 
         # Loaded values as un_signed. Convert to 2's complement form:
-        # values > 2^11-1 are negative.
-        sig[sig > 2047] -= 4096
+        # values > 2^11-1 are negative. Shifting the 12-bit values to
+        # the top of the 16-bit word and back extends the sign bit
+        # without a comparison mask.
+        sig <<= 4
+        sig >>= 4
 
     elif fmt == "310":
         sig_data = sig_data.astype("int16")
-        sig = np.zeros(n_samp, dtype="int16")
+        sig = np.empty(n_samp, dtype="int16")
 
         # One sample triplet is stored in one byte quartet
         # First sample is 7 msb of first byte and 3 lsb of second byte.
@@ -1726,11 +1729,12 @@ def _blocks_to_samples(sig_data, n_samp, fmt):
 
         # Loaded values as un_signed. Convert to 2's complement form:
         # values > 2^9-1 are negative.
-        sig[sig > 511] -= 1024
+        sig <<= 6
+        sig >>= 6
 
     elif fmt == "311":
         sig_data = sig_data.astype("int16")
-        sig = np.zeros(n_samp, dtype="int16")
+        sig = np.empty(n_samp, dtype="int16")
 
         # One sample triplet is stored in one byte quartet
         # First sample is first byte and 2 lsb of second byte.
@@ -1749,7 +1753,8 @@ def _blocks_to_samples(sig_data, n_samp, fmt):
 
         # Loaded values as un_signed. Convert to 2's complement form.
         # Values > 2^9-1 are negative.
-        sig[sig > 511] -= 1024
+        sig <<= 6
+        sig >>= 6
 
     elif fmt == "24":
         # The following is equivalent to:
@@ -2204,11 +2209,13 @@ def _fmt_res(fmt, max_res=False):
 
     """
     if isinstance(fmt, list):
+        # Look up each element directly rather than recursing and
+        # repeating the type check for every channel
         if max_res:
             # Allow None
-            bit_res = np.max([_fmt_res(f) for f in fmt if f is not None])
+            bit_res = np.max([BIT_RES[f] for f in fmt if f is not None])
         else:
-            bit_res = [_fmt_res(f) for f in fmt]
+            bit_res = [BIT_RES[f] for f in fmt]
         return bit_res
 
     return BIT_RES[fmt]
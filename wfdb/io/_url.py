@@ -3,6 +3,7 @@
 import os
 import platform
 import re
+import socket
 import threading
 import urllib.parse
 import urllib.request
@@ -17,6 +18,18 @@
 # Default buffer size for remote files.
 DEFAULT_BUFFER_SIZE = 32768
 
+# Maximum number of hosts for which connection pools are kept open.
+MAX_POOLS = 16
+
+# Maximum number of simultaneous connections to a single host.
+MAX_CONNECTIONS = 5
+
+# Number of times to retry a request that failed to connect.
+MAX_RETRIES = 3
+
+# Backoff factor (in seconds) applied between successive retries.
+RETRY_BACKOFF_FACTOR = 0.3
+
 # Logger for this module.
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,6 +60,8 @@ def _get_session():
     """
     import requests
     import requests.adapters
+    import urllib3.connection
+    import urllib3.util.retry
 
     global _SESSION
     global _SESSION_PID
@@ -65,9 +80,41 @@ def _get_session():
                     ),
                 ]
             )
+            # Connections are kept alive and reused across requests, so
+            # only the first request to each host pays for the TCP and
+            # TLS handshakes.
+            retries = urllib3.util.retry.Retry(
+                total=MAX_RETRIES,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                raise_on_status=False,
+            )
+            # Disable Nagle's algorithm (the urllib3 default) and enable
+            # TCP keep-alive, so that idle pooled connections which have
+            # been dropped along the way are detected.
+            socket_options = (
+                urllib3.connection.HTTPConnection.default_socket_options
+                + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+
+            class KeepAliveAdapter(requests.adapters.HTTPAdapter):
+                """
+                Transport adapter that applies the socket options to
+                both direct and proxied connections.
+                """
+
+                def init_poolmanager(self, *args, **kwargs):
+                    kwargs["socket_options"] = socket_options
+                    super().init_poolmanager(*args, **kwargs)
+
+                def proxy_manager_for(self, proxy, **proxy_kwargs):
+                    proxy_kwargs["socket_options"] = socket_options
+                    return super().proxy_manager_for(proxy, **proxy_kwargs)
+
             for protocol in ("http", "https"):
-                adapter = requests.adapters.HTTPAdapter(
-                    pool_maxsize=2,
+                adapter = KeepAliveAdapter(
+                    pool_connections=MAX_POOLS,
+                    pool_maxsize=MAX_CONNECTIONS,
+                    max_retries=retries,
                     pool_block=True,
                 )
                 _SESSION.mount("%s://" % protocol, adapter)
@@ -486,10 +533,10 @@ def _read_range(self, start, end):
             if buffer_store:
                 # Load data into buffer and then return a copy to the
                 # caller.
-                (start, data) = xfer.content()
+                (buffer_start, data) = xfer.content()
                 self._buffer = data
-                self._buffer_start = start
-                self._buffer_end = start + len(data)
+                self._buffer_start = buffer_start
+                self._buffer_end = buffer_start + len(data)
                 if end is None:
                     end = self._buffer_end
                 yield self._read_buffered_range(start, end)
@@ -582,6 +629,29 @@ def read(self, size=-1):
         self._pos += len(result)
         return result
 
+    def iter_chunks(self):
+        """
+        Iterate over the rest of the file as a sequence of chunks.
+
+        The data is retrieved in a single request and is not stored in
+        the internal buffer, so the whole file need not be held in
+        memory at once.
+
+        Parameters
+        ----------
+        N/A
+
+        Yields
+        ------
+        data : memoryview
+            A memoryview containing the next chunk of the file.  The
+            sizes of the individual chunks are unspecified.
+
+        """
+        for chunk in self._read_range(self._pos, None):
+            self._pos += len(chunk)
+            yield chunk
+
     def read1(self, size=-1):
         """
         Read bytes from the file.
@@ -1,7 +1,12 @@
+import concurrent.futures
+import functools
 import json
-import multiprocessing.dummy
 import os
 import posixpath
+import re
+import shutil
+import stat
+import time
 
 import numpy as np
 
@@ -12,6 +17,17 @@
 PN_INDEX_URL = "https://physionet.org/files/"
 PN_CONTENT_URL = "https://physionet.org/content/"
 
+# Chunk size used when copying local (file://) sources to disk.
+_COPY_CHUNK_SIZE = 1 << 20
+
+# Number of seconds for which a looked up project version is reused.
+DB_VERSION_TTL = 600
+# Recently looked up project versions, as {db_dir: (version, time)}
+_DB_VERSIONS = {}
+
+# A version directory of a PhysioNet project, such as "1.0.0"
+_rx_version = re.compile(r"\d+(?:\.\d+)+")
+
 
 class Config(object):
     """
@@ -48,6 +64,9 @@ def set_db_index_url(db_index_url=PN_INDEX_URL):
 
     """
     config.db_index_url = db_index_url
+    # Forget anything retrieved from the previous location
+    _get_header_content.cache_clear()
+    _DB_VERSIONS.clear()
 
 
 def _remote_file_size(url=None, file_name=None, pn_dir=None):
@@ -104,11 +123,63 @@ def _stream_header(file_name: str, pn_dir: str) -> str:
     # Full url of header location
     url = posixpath.join(config.db_index_url, pn_dir, file_name)
 
-    # Get the content of the remote file
+    # Get the content of the remote file. Only the files of a versioned
+    # PhysioNet project are known not to change, so only those are cached.
+    if _is_versioned_pn_url(url):
+        content = _get_header_content(url)
+    else:
+        with _url.openurl(url, "rb") as f:
+            content = f.read()
+
+    return content.decode("iso-8859-1")
+
+
+def _is_versioned_pn_url(url):
+    """
+    Check whether a url points into a versioned PhysioNet project
+    directory, such as 'https://physionet.org/files/mitdb/1.0.0/100.hea'.
+
+    Parameters
+    ----------
+    url : str
+        The full url of the file.
+
+    Returns
+    -------
+    N/A : bool
+        Whether the url is in a versioned PhysioNet project directory.
+
+    """
+    if not url.startswith(PN_INDEX_URL):
+        return False
+    # The project slug, version, and the path within the project
+    path_parts = url[len(PN_INDEX_URL) :].split("/")
+    return len(path_parts) > 2 and bool(_rx_version.fullmatch(path_parts[1]))
+
+
+@functools.lru_cache(maxsize=256)
+def _get_header_content(url):
+    """
+    Get the content of a remote header file from a versioned PhysioNet
+    project. The results are cached, since the files in a versioned
+    project do not change, and the same header is often read many times
+    (for example, when reading a record in chunks).
+
+    Parameters
+    ----------
+    url : str
+        The full url of the header file.
+
+    Returns
+    -------
+    content : bytes
+        The content of the header file.
+
+    """
     with _url.openurl(url, "rb") as f:
         content = f.read()
 
-    return content.decode("iso-8859-1")
+    return content
 
 
 def _stream_dat(file_name, pn_dir, byte_count, start_byte, dtype):
@@ -137,13 +208,13 @@ def _stream_dat(file_name, pn_dir, byte_count, start_byte, dtype):
     # Full url of dat file
     url = posixpath.join(config.db_index_url, pn_dir, file_name)
 
-    # Get the content
-    with _url.openurl(url, "rb", buffering=0) as f:
-        f.seek(start_byte)
-        content = f.read(byte_count)
+    # Read the content directly into a numpy array
+    sig_bytes = np.empty(byte_count, dtype=np.uint8)
+    with _url.openurl(url, "rb", buffering=0) as dat_file:
+        dat_file.seek(start_byte)
+        n_read = dat_file.readinto(sig_bytes)
 
-    # Convert to numpy array
-    sig_data = np.fromstring(content, dtype=dtype)
+    sig_data = sig_bytes[:n_read].view(dtype)
 
     return sig_data
 
@@ -173,7 +244,7 @@ def _stream_annotation(file_name, pn_dir):
         content = f.read()
 
     # Convert to numpy array
-    ann_data = np.fromstring(content, dtype=np.dtype("<u1"))
+    ann_data = np.frombuffer(content, dtype="<u1")
 
     return ann_data
 
@@ -233,6 +304,37 @@ def get_version(pn_dir):
 
     """
     db_dir = pn_dir.split("/")[0]
+
+    # Every call that streams a file from an unversioned directory needs
+    # the version, so a recent lookup is reused. It expires so that a
+    # long-running process still sees new releases.
+    now = time.monotonic()
+    if db_dir in _DB_VERSIONS:
+        version_number, lookup_time = _DB_VERSIONS[db_dir]
+        if now - lookup_time < DB_VERSION_TTL:
+            return version_number
+
+    version_number = _get_db_version(db_dir)
+    _DB_VERSIONS[db_dir] = (version_number, now)
+
+    return version_number
+
+
+def _get_db_version(db_dir):
+    """
+    Get the version number of a project from its PhysioNet page.
+
+    Parameters
+    ----------
+    db_dir : str
+        The project slug.
+
+    Returns
+    -------
+    version_number : str
+        The version number of the most recent database.
+
+    """
     url = posixpath.join(PN_CONTENT_URL, db_dir) + "/"
     with _url.openurl(url, "rb") as f:
         content = f.read()
@@ -421,14 +523,20 @@ def dl_pn_file(inputs):
 
     local_file = os.path.join(dldir, basefile)
 
+    # Get the local file's size, if it exists, with a single stat call.
+    try:
+        local_stat = os.stat(local_file)
+    except FileNotFoundError:
+        local_stat = None
+
     # The file exists locally.
-    if os.path.isfile(local_file):
+    if local_stat is not None and stat.S_ISREG(local_stat.st_mode):
         # Redownload regardless
         if overwrite:
             dl_full_file(url, local_file)
         # Process accordingly.
         else:
-            local_file_size = os.path.getsize(local_file)
+            local_file_size = local_stat.st_size
             with _url.openurl(url, "rb") as f:
                 remote_file_size = f.seek(0, os.SEEK_END)
                 # Local file is smaller than it should be. Append it.
@@ -439,7 +547,7 @@ def dl_pn_file(inputs):
                     )
                     f.seek(local_file_size, os.SEEK_SET)
                     with open(local_file, "ba") as writefile:
-                        writefile.write(f.read())
+                        _copy_file(f, writefile)
                     print("Done appending.")
                 # Local file is larger than it should be. Redownload.
                 elif local_file_size > remote_file_size:
@@ -453,6 +561,40 @@ def dl_pn_file(inputs):
     return
 
 
+def dl_pn_files(dl_inputs):
+    """
+    Download a list of files from Physionet concurrently. The local
+    directories must already exist (see `make_local_dirs`).
+
+    Parameters
+    ----------
+    dl_inputs : list
+        The inputs of `dl_pn_file` for each file to download.
+
+    Returns
+    -------
+    N/A
+
+    """
+    print("Downloading files...")
+    # Use multiple threads to download files. Limit the number of
+    # connections to avoid overloading the server.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=_url.MAX_CONNECTIONS
+    ) as executor:
+        # Files shared by several signals are listed more than once,
+        # but must only be written by one thread.
+        futures = [
+            executor.submit(dl_pn_file, inputs)
+            for inputs in dict.fromkeys(dl_inputs)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+    print("Finished downloading files")
+
+    return
+
+
 def dl_full_file(url, save_file_name):
     """
     Download a file. No checks are performed.
@@ -469,14 +611,48 @@ def dl_full_file(url, save_file_name):
     N/A
 
     """
-    with _url.openurl(url, "rb") as readfile:
-        content = readfile.read()
-    with open(save_file_name, "wb") as writefile:
-        writefile.write(content)
+    # Write to a temporary file next to the target, and only replace the
+    # target once the whole file has been retrieved, so that a missing
+    # remote file or a failed connection leaves any local file intact.
+    temp_file_name = save_file_name + ".part"
+    try:
+        with _url.openurl(url, "rb") as readfile:
+            with open(temp_file_name, "wb") as writefile:
+                _copy_file(readfile, writefile)
+        os.replace(temp_file_name, save_file_name)
+    except BaseException:
+        if os.path.exists(temp_file_name):
+            os.remove(temp_file_name)
+        raise
 
     return
 
 
+def _copy_file(readfile, writefile):
+    """
+    Copy the rest of an opened file to another file, chunk by chunk,
+    so that large files are never held in memory at once.
+
+    Parameters
+    ----------
+    readfile : io.IOBase
+        The binary file object to copy from, as returned by
+        `_url.openurl`.
+    writefile : io.IOBase
+        The binary file object to write to.
+
+    Returns
+    -------
+    N/A
+
+    """
+    if isinstance(readfile, _url.NetFile):
+        for chunk in readfile.iter_chunks():
+            writefile.write(chunk)
+    else:
+        shutil.copyfileobj(readfile, writefile, _COPY_CHUNK_SIZE)
+
+
 def dl_files(db, dl_dir, files, keep_subdirs=True, overwrite=False):
     """
     Download specified files from a PhysioNet database.
@@ -538,11 +714,6 @@ def dl_files(db, dl_dir, files, keep_subdirs=True, overwrite=False):
     # Make any required local directories
     make_local_dirs(dl_dir, dl_inputs, keep_subdirs)
 
-    print("Downloading files...")
-    # Create multiple processes to download files.
-    # Limit to 2 connections to avoid overloading the server
-    pool = multiprocessing.dummy.Pool(processes=2)
-    pool.map(dl_pn_file, dl_inputs)
-    print("Finished downloading files")
+    dl_pn_files(dl_inputs)
 
     return
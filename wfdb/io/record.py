@@ -1,5 +1,5 @@
+import concurrent.futures
 import datetime
-import multiprocessing.dummy
 import posixpath
 import os
 import re
@@ -448,7 +448,7 @@ def check_field(self, field, required_channels="all"):
                 raise ValueError("sig_len must be a non-negative integer")
 
         # Signal specification fields
-        elif field in _header.SIGNAL_SPECS.index:
+        elif field in _header.SIGNAL_SPECS:
             if required_channels == "all":
                 required_channels = range(len(item))
 
@@ -527,7 +527,7 @@ def check_field(self, field, required_channels="all"):
                         raise ValueError("sig_name strings must be unique.")
 
         # Segment specification fields and comments
-        elif field in _header.SEGMENT_SPECS.index:
+        elif field in _header.SEGMENT_SPECS:
             for ch in range(len(item)):
                 if field == "seg_name":
                     # Segment names must be alphanumerics or just a single '~'
@@ -944,7 +944,7 @@ def _arrange_fields(self, channels, sampfrom, smooth_frames):
 
         """
         # Rearrange signal specification fields
-        for field in _header.SIGNAL_SPECS.index:
+        for field in _header.SIGNAL_SPECS:
             item = getattr(self, field)
             setattr(self, field, [item[c] for c in channels])
 
@@ -1278,20 +1278,25 @@ def _required_channels(self, seg_numbers, channels, dir_name, pn_dir):
             l_sig_names = self.segments[0].sig_name
             # The wanted signals
             w_sig_names = [l_sig_names[c] for c in channels]
+            # The signal names of each distinct segment read so far
+            seg_sig_names = {}
 
             # For each segment
             for i in range(len(seg_numbers)):
+                seg_name = self.seg_name[seg_numbers[i]]
                 # Skip empty segments
-                if self.seg_name[seg_numbers[i]] == "~":
+                if seg_name == "~":
                     required_channels.append([])
                 else:
                     # Get the signal names of the current segment
-                    s_sig_names = rdheader(
-                        os.path.join(dir_name, self.seg_name[seg_numbers[i]]),
-                        pn_dir=pn_dir,
-                    ).sig_name
+                    if seg_name not in seg_sig_names:
+                        seg_sig_names[seg_name] = rdheader(
+                            os.path.join(dir_name, seg_name), pn_dir=pn_dir
+                        ).sig_name
                     required_channels.append(
-                        _get_wanted_channels(w_sig_names, s_sig_names)
+                        _get_wanted_channels(
+                            w_sig_names, seg_sig_names[seg_name]
+                        )
                     )
 
         return required_channels
@@ -1377,12 +1382,11 @@ def _arrange_fields(
                     if name in contained_sig_names
                 ]
                 # Channel indices to keep for signal specification fields
-                channels = [
-                    self.segments[0].sig_name.index(name) for name in sig_name
-                ]
+                channel_inds = _get_channel_inds(self.segments[0].sig_name)
+                channels = [channel_inds[name] for name in sig_name]
 
             # Rearrange signal specification fields
-            for field in _header.SIGNAL_SPECS.index:
+            for field in _header.SIGNAL_SPECS:
                 item = getattr(self.segments[0], field)
                 setattr(self.segments[0], field, [item[c] for c in channels])
 
@@ -1462,6 +1466,7 @@ def multi_to_single(self, physical, return_res=64, expanded=False):
 
             # These signal names will be the key
             signal_names = self.segments[0].sig_name
+            signal_inds = _get_channel_inds(signal_names)
             n_sig = len(signal_names)
 
             # This will be the field dictionary to copy over.
@@ -1484,7 +1489,7 @@ def multi_to_single(self, physical, return_res=64, expanded=False):
                 for seg_ch in range(seg.n_sig):
                     sig_name = seg.sig_name[seg_ch]
                     # The overall channel
-                    ch = signal_names.index(sig_name)
+                    ch = signal_inds[sig_name]
 
                     for field in reference_fields:
                         item_ch = getattr(seg, field)[seg_ch]
@@ -1606,12 +1611,9 @@ def multi_to_single(self, physical, return_res=64, expanded=False):
 
 # Allowed types of WFDB header fields, and also attributes defined in
 # this library
-ALLOWED_TYPES = dict(
-    [
-        [index, _header.FIELD_SPECS.loc[index, "allowed_types"]]
-        for index in _header.FIELD_SPECS.index
-    ]
-)
+ALLOWED_TYPES = {
+    field: spec.allowed_types for field, spec in _header.FIELD_SPECS.items()
+}
 ALLOWED_TYPES.update(
     {
         "comments": (str,),
@@ -1624,7 +1626,7 @@ def multi_to_single(self, physical, return_res=64, expanded=False):
 )
 
 # Fields that must be lists
-LIST_FIELDS = tuple(_header.SIGNAL_SPECS.index) + (
+LIST_FIELDS = tuple(_header.SIGNAL_SPECS) + (
     "comments",
     "e_p_signal",
     "e_d_signal",
@@ -1844,14 +1846,21 @@ def rdheader(record_name, pn_dir=None, rd_segments=False):
 
         # If specified, read the segment headers
         if rd_segments:
-            record.segments = []
-            # Get the base record name (could be empty)
-            for s in record.seg_name:
-                if s == "~":
-                    record.segments.append(None)
-                else:
-                    record.segments.append(
-                        rdheader(os.path.join(dir_name, s), pn_dir)
+
+            def rd_segment(seg_name):
+                if seg_name == "~":
+                    return None
+                return rdheader(os.path.join(dir_name, seg_name), pn_dir)
+
+            if pn_dir is None:
+                record.segments = [rd_segment(s) for s in record.seg_name]
+            else:
+                # Request the remote segment headers concurrently
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_url.MAX_CONNECTIONS
+                ) as executor:
+                    record.segments = list(
+                        executor.map(rd_segment, record.seg_name)
                     )
             # Fill in the sig_name attribute
             record.sig_name = record.get_sig_name()
@@ -2048,7 +2057,7 @@ def rdrecord(
     if not len(channels):
         old_record = record
         record = Record()
-        for attr in _header.RECORD_SPECS.index:
+        for attr in _header.RECORD_SPECS:
             if attr == "n_seg":
                 continue
             elif attr in ["n_sig", "sig_len"]:
@@ -2124,11 +2133,15 @@ def rdrecord(
 
         record.segments = [None] * record.n_seg
 
-        # Variable layout, read the layout specification header
+        # Variable layout, read the layout specification header (unless
+        # it was already read to find the channel names)
         if record.layout == "variable":
-            record.segments[0] = rdheader(
-                os.path.join(dir_name, record.seg_name[0]), pn_dir=pn_dir
-            )
+            if channel_names is not None:
+                record.segments[0] = reference_record
+            else:
+                record.segments[0] = rdheader(
+                    os.path.join(dir_name, record.seg_name[0]), pn_dir=pn_dir
+                )
 
         # The segment numbers and samples within each segment to read.
         seg_numbers, seg_ranges = record._required_segments(sampfrom, sampto)
@@ -2754,17 +2767,33 @@ def _get_wanted_channels(wanted_sig_names, record_sig_names, pad=False):
         The indices of the wanted record channel names.
 
     """
+    channel_inds = _get_channel_inds(record_sig_names)
     if pad:
-        return [
-            record_sig_names.index(s) if s in record_sig_names else None
-            for s in wanted_sig_names
-        ]
+        return [channel_inds.get(s) for s in wanted_sig_names]
     else:
-        return [
-            record_sig_names.index(s)
-            for s in wanted_sig_names
-            if s in record_sig_names
-        ]
+        return [channel_inds[s] for s in wanted_sig_names if s in channel_inds]
+
+
+def _get_channel_inds(sig_names):
+    """
+    Map signal names to channel indices, so that many channels can be
+    looked up by name without searching the list of names each time.
+
+    Parameters
+    ----------
+    sig_names : list
+        List of signal names for a single record.
+
+    Returns
+    -------
+    dict
+        The index of the first channel with each signal name.
+
+    """
+    channel_inds = {}
+    for ch, name in enumerate(sig_names):
+        channel_inds.setdefault(name, ch)
+    return channel_inds
 
 
 # ------------------- /Reading Records -------------------#
@@ -2921,6 +2950,152 @@ def wrsamp(
     record.wrsamp(write_dir=write_dir)
 
 
+def _rd_record_header(rec, db_dir):
+    """
+    Read the header of a record in a PhysioNet database. Helper function
+    for `dl_database`.
+
+    Parameters
+    ----------
+    rec : str
+        The record name, relative to the database's home directory.
+    db_dir : str
+        The PhysioNet database directory, including the version.
+
+    Returns
+    -------
+    record : Record, MultiRecord
+        The record's header fields.
+
+    """
+    print("Generating list of all files for: " + rec)
+    dir_name, base_rec_name = os.path.split(rec)
+    return rdheader(base_rec_name, pn_dir=posixpath.join(db_dir, dir_name))
+
+
+def _get_record_files(rec, record, db_dir, annotators, executor):
+    """
+    Get the list of files that make up a record in a PhysioNet
+    database, given its header. The segment headers and annotation
+    files that need to be requested are submitted to the executor.
+    Helper function for `dl_database`.
+
+    Parameters
+    ----------
+    rec : str
+        The record name, relative to the database's home directory.
+    record : Record, MultiRecord
+        The record's header fields.
+    db_dir : str
+        The PhysioNet database directory, including the version.
+    annotators : list, None
+        The annotation file extensions to look for.
+    executor : concurrent.futures.Executor
+        The executor used to make the requests.
+
+    Returns
+    -------
+    rec_files : list
+        The names of the record's files (relative to the database's
+        home directory) known from its header.
+    futures : list
+        Futures of the lists of the record's other files that exist in
+        the database, in order.
+
+    """
+    # If MIT format, have to figure out all associated files
+    rec_files = [rec + ".hea"]
+    futures = []
+    dir_name = os.path.split(rec)[0]
+
+    # Single segment record
+    if isinstance(record, Record):
+        # Add all dat files of the segment
+        for file in record.file_name if record.file_name else []:
+            rec_files.append(posixpath.join(dir_name, file))
+
+    # Multi segment record
+    else:
+        # Add the headers, skipping empty segments
+        seg_names = [seg for seg in record.seg_name if seg != "~"]
+        for seg in seg_names:
+            rec_files.append(posixpath.join(dir_name, seg + ".hea"))
+
+        # Read each distinct segment header to find its dat files.
+        # Layout specifiers have no dat files.
+        for seg in dict.fromkeys(seg_names):
+            if not seg.endswith("_layout"):
+                futures.append(
+                    executor.submit(_get_segment_files, seg, dir_name, db_dir)
+                )
+
+    # Check whether the record has any requested annotation files
+    if annotators is not None:
+        for a in annotators:
+            futures.append(
+                executor.submit(_get_annotation_files, rec + "." + a, db_dir)
+            )
+
+    return rec_files, futures
+
+
+def _get_segment_files(seg, dir_name, db_dir):
+    """
+    Get the dat files of a segment of a multi-segment record in a
+    PhysioNet database. Helper function for `dl_database`.
+
+    Parameters
+    ----------
+    seg : str
+        The segment name.
+    dir_name : str
+        The directory of the record, relative to the database's home
+        directory.
+    db_dir : str
+        The PhysioNet database directory, including the version.
+
+    Returns
+    -------
+    seg_files : list
+        The names of the segment's dat files, relative to the database's
+        home directory.
+
+    """
+    rec_seg = rdheader(seg, pn_dir=posixpath.join(db_dir, dir_name))
+    return [
+        posixpath.join(dir_name, file)
+        for file in (rec_seg.file_name if rec_seg.file_name else [])
+    ]
+
+
+def _get_annotation_files(ann_file, db_dir):
+    """
+    Check whether an annotation file exists in a PhysioNet database.
+    Helper function for `dl_database`.
+
+    Parameters
+    ----------
+    ann_file : str
+        The annotation file name, relative to the database's home
+        directory.
+    db_dir : str
+        The PhysioNet database directory, including the version.
+
+    Returns
+    -------
+    ann_files : list
+        The annotation file name if the file exists, otherwise an
+        empty list.
+
+    """
+    url = posixpath.join(download.config.db_index_url, db_dir, ann_file)
+    try:
+        _url.openurl(url, check_access=True)
+    except FileNotFoundError:
+        return []
+    return [ann_file]
+
+
 def dl_database(
     db_dir,
     dl_dir,
@@ -2999,60 +3174,45 @@ def dl_database(
     all_files = []
     nested_records = []
 
-    for rec in record_list:
-        print("Generating record list for: " + rec)
-        # May be pointing to directory
-        if rec.endswith(os.sep):
-            nested_records += [
-                posixpath.join(rec, sr)
-                for sr in download.get_record_list(posixpath.join(db_dir, rec))
-            ]
-        else:
-            nested_records.append(rec)
-
-    for rec in nested_records:
-        print("Generating list of all files for: " + rec)
-        # If MIT format, have to figure out all associated files
-        all_files.append(rec + ".hea")
-        dir_name, base_rec_name = os.path.split(rec)
-        record = rdheader(
-            base_rec_name, pn_dir=posixpath.join(db_dir, dir_name)
-        )
-
-        # Single segment record
-        if isinstance(record, Record):
-            # Add all dat files of the segment
-            for file in record.file_name if record.file_name else []:
-                all_files.append(posixpath.join(dir_name, file))
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=_url.MAX_CONNECTIONS
+    ) as executor:
+        # Fetch the record lists of any nested directories concurrently,
+        # keeping at most MAX_CONNECTIONS small requests in flight.
+        sub_lists = {
+            rec: executor.submit(
+                download.get_record_list, posixpath.join(db_dir, rec)
+            )
+            for rec in record_list
+            if rec.endswith(os.sep)
+        }
+        for rec in record_list:
+            print("Generating record list for: " + rec)
+            # May be pointing to directory
+            if rec in sub_lists:
+                nested_records += [
+                    posixpath.join(rec, sr) for sr in sub_lists[rec].result()
+                ]
+            else:
+                nested_records.append(rec)
 
-        # Multi segment record
-        else:
-            for seg in record.seg_name:
-                # Skip empty segments
-                if seg == "~":
-                    continue
-                # Add the header
-                all_files.append(posixpath.join(dir_name, seg + ".hea"))
-                # Layout specifier has no dat files
-                if seg.endswith("_layout"):
-                    continue
-                # Add all dat files of the segment
-                rec_seg = rdheader(seg, pn_dir=posixpath.join(db_dir, dir_name))
-                for file in rec_seg.file_name:
-                    all_files.append(posixpath.join(dir_name, file))
-
-        # Check whether the record has any requested annotation files
-        if annotators is not None:
-            for a in annotators:
-                ann_file = rec + "." + a
-                url = posixpath.join(
-                    download.config.db_index_url, db_dir, ann_file
-                )
-                try:
-                    _url.openurl(url, check_access=True)
-                    all_files.append(ann_file)
-                except FileNotFoundError:
-                    pass
+        # Read the record headers concurrently, since each record
+        # requires its own requests.
+        records = executor.map(
+            lambda rec: _rd_record_header(rec, db_dir), nested_records
+        )
+        # Then request the segment headers and annotation files of all
+        # the records through the same executor, and collect the files
+        # in order. Waiting on the futures from this thread (rather than
+        # from the workers) cannot exhaust the pool.
+        record_files = [
+            _get_record_files(rec, record, db_dir, annotators, executor)
+            for rec, record in zip(nested_records, records)
+        ]
+        for rec_files, futures in record_files:
+            all_files += rec_files
+            for future in futures:
+                all_files += future.result()
 
     dl_inputs = [
         (
@@ -3069,11 +3229,6 @@ def dl_database(
     # Make any required local directories
     download.make_local_dirs(dl_dir, dl_inputs, keep_subdirs)
 
-    print("Downloading files...")
-    # Create multiple processes to download files.
-    # Limit to 2 connections to avoid overloading the server
-    pool = multiprocessing.dummy.Pool(processes=2)
-    pool.map(download.dl_pn_file, dl_inputs)
-    print("Finished downloading files")
+    download.dl_pn_files(dl_inputs)
 
     return